@@ -10,18 +10,31 @@ Requirements:
 
 Notes:
  - Targets Apache Jira instance: https://issues.apache.org/jira
- - Uses REST API v2 search endpoint and issue endpoint for comments.
+ - Uses REST API v2 search endpoint. Comments come embedded in search results and the
+   issue endpoint is only hit for issues whose comment list was truncated.
+ - Response decoding and the LLM transform run in a process pool; only raw bytes and
+   finished JSONL lines pass between it and the async fetchers.
+ - Projects are scraped concurrently with aiohttp; issue fetches are bounded by CONCURRENCY
+   and all requests share one REQUESTS_PER_MINUTE token bucket, lowered to the rate Jira
+   advertises in its X-RateLimit-* headers.
  - Produces raw JSONL and a transformed JSONL suitable for LLM fine-tuning.
 """
 
 import os
 import time
-import json
+import asyncio
+import hashlib
 import logging
-from typing import Dict, Any, List
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util import Retry
+import multiprocessing
+import operator
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Tuple
+import aiohttp
+import orjson
+from aiolimiter import AsyncLimiter
+from pybloom_live import ScalableBloomFilter
 from tqdm import tqdm
 
 # ---------- CONFIG ----------
@@ -29,11 +42,15 @@ JIRA_BASE = "https://issues.apache.org/jira"
 SEARCH_ENDPOINT = "/rest/api/2/search"
 ISSUE_ENDPOINT = "/rest/api/2/issue/{issue_id_or_key}"
 PROJECTS = ["HADOOP", "SPARK", "KAFKA"]  # 3 projects of my choice
-FIELDS = "summary,description,comment,creator,reporter,assignee,labels,priority,status,created,updated,issuetype"
-MAX_RESULTS = 50  # page size (server may cap this)
+FIELDS = "summary,description,comment,reporter,assignee,labels,priority,status,created,updated,issuetype,project"
+MAX_RESULTS = 1000  # page size; the server caps this (often lower) and we follow what it returns
 REQUESTS_PER_MINUTE = 60  # throttle; set lower if you get 429s
+CONCURRENCY = 20  # max in-flight issue fetches; set lower if you get 429s
+MAX_ATTEMPTS = 6  # per request, for 429 and 5xx responses
+WRITE_QUEUE_PAGES = 8  # scraped pages buffered for the writer before scrapers wait on disk
 OUTPUT_DIR = "output"
 STATE_DIR = "state"
+STATE_VERSION = 2  # bump when the checkpoint layout changes
 LOG_LEVEL = logging.INFO
 
 # ---------- Logging ----------
@@ -41,51 +58,241 @@ os.makedirs(OUTPUT_DIR, exist_ok=True)
 os.makedirs(STATE_DIR, exist_ok=True)
 logging.basicConfig(level=LOG_LEVEL, format="%(asctime)s [%(levelname)s] %(message)s")
 
-# ---------- HTTP session with retries ----------
-session = requests.Session()
-retries = Retry(
-    total=5,
-    backoff_factor=1,
-    status_forcelist=[429, 500, 502, 503, 504],
-    allowed_methods=["GET", "POST", "PUT", "DELETE", "HEAD", "OPTIONS"],
-)
-adapter = HTTPAdapter(max_retries=retries)
-session.mount("https://", adapter)
-session.mount("http://", adapter)
 
-# small helper to respect RPM
-SECONDS_BETWEEN = 60.0 / REQUESTS_PER_MINUTE if REQUESTS_PER_MINUTE > 0 else 0
-
-
-def throttle_sleep(last_time):
-    if SECONDS_BETWEEN <= 0:
-        return time.time()
-    now = time.time()
-    to_wait = SECONDS_BETWEEN - (now - last_time)
-    if to_wait > 0:
-        time.sleep(to_wait)
-    return time.time()
+def make_session() -> aiohttp.ClientSession:
+    """One HTTP session per run; connections are pooled and kept alive across requests."""
+    connector = aiohttp.TCPConnector(
+        limit=64,
+        # every issue fetch plus one search request per project, so nothing queues for a connection
+        limit_per_host=CONCURRENCY + len(PROJECTS),
+        ttl_dns_cache=300,
+        keepalive_timeout=60,
+    )
+    # Accept-Encoding is left to aiohttp: it offers br (and zstd) whenever it can decode them
+    headers = {"User-Agent": "apache-jira-scraper/1.0"}
+    # bound connect and per-read stalls rather than the whole request: a 1000-issue page can take a while to download
+    timeout = aiohttp.ClientTimeout(total=None, sock_connect=30, sock_read=30)
+    return aiohttp.ClientSession(connector=connector, headers=headers, timeout=timeout)
+
+
+class RateLimiter:
+    """Token bucket shared by every request to JIRA_BASE, across all projects.
+    Starts at REQUESTS_PER_MINUTE; follows Jira's X-RateLimit-* fill rate when that is lower."""
+
+    def __init__(self, per_minute: float):
+        self.per_minute = per_minute
+        self._bucket = self._make_bucket(per_minute) if per_minute > 0 else None
+
+    @staticmethod
+    def _make_bucket(per_minute: float) -> AsyncLimiter:
+        # capacity 1: requests are spaced 60/per_minute seconds apart, like the old SECONDS_BETWEEN
+        # throttle, instead of a full minute's budget bursting out at once when CONCURRENCY fetches start
+        return AsyncLimiter(1, 60 / per_minute)
+
+    async def __aenter__(self):
+        if self._bucket is not None:
+            await self._bucket.acquire()
+
+    async def __aexit__(self, *exc):
+        return None
+
+    def update_from_headers(self, headers):
+        fill_rate = headers.get("X-RateLimit-FillRate")
+        interval = headers.get("X-RateLimit-Interval-Seconds")
+        if not (fill_rate and interval):
+            return
+        try:
+            per_minute = float(fill_rate) * 60 / float(interval)
+        except (ValueError, ZeroDivisionError):
+            return
+        if REQUESTS_PER_MINUTE > 0:
+            per_minute = min(per_minute, REQUESTS_PER_MINUTE)
+        if per_minute <= 0 or per_minute == self.per_minute:
+            return
+        logging.info("Jira allows %.1f requests/minute; adjusting rate limit", per_minute)
+        self.per_minute = per_minute
+        self._bucket = self._make_bucket(per_minute)
+
+
+async def get_with_retry(
+    session: aiohttp.ClientSession, limiter: RateLimiter, url: str, params: Dict[str, Any]
+) -> bytes:
+    """GET url and return the body, retrying 429/5xx, dropped connections and timeouts (body read included)
+    up to MAX_ATTEMPTS times with Retry-After or jittered exponential backoff."""
+    for attempt in range(MAX_ATTEMPTS):
+        last_attempt = attempt == MAX_ATTEMPTS - 1
+        ra = None
+        try:
+            async with limiter, session.get(url, params=params) as r:
+                limiter.update_from_headers(r.headers)
+                if (r.status != 429 and r.status < 500) or last_attempt:
+                    r.raise_for_status()
+                    body = await r.read()
+                    logging.debug("%s: %d bytes decoded from Content-Encoding %s",
+                                  url, len(body), r.headers.get("Content-Encoding", "identity"))
+                    return body
+                ra = r.headers.get("Retry-After")
+                reason = f"HTTP {r.status}"
+        except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError) as e:
+            if last_attempt:
+                raise
+            reason = repr(e)
+        wait = (int(ra) if ra and ra.isdigit() else min(60, 2 ** attempt)) + random.uniform(0, 1)
+        logging.warning("%s for %s; retrying in %.1f seconds", reason, url, wait)
+        await asyncio.sleep(wait)
+
+
+def config_hash() -> str:
+    """Fingerprint of the settings that shape the records written (not MAX_RESULTS: startAt is absolute)."""
+    return hashlib.sha1(FIELDS.encode("utf-8")).hexdigest()
+
+
+def keys_path(project_key: str) -> str:
+    return os.path.join(STATE_DIR, f"{project_key}.keys")
 
 
 def read_state(project_key: str) -> Dict[str, Any]:
+    """Load the checkpoint. One from another config starts a fresh corpus,
+    setting the old outputs and key log aside."""
     path = os.path.join(STATE_DIR, f"{project_key}.json")
-    if os.path.exists(path):
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    return {"startAt": 0, "seen_issue_keys": []}
+    try:
+        with open(path, "rb") as f:
+            state = orjson.loads(f.read())
+    except FileNotFoundError:
+        return {"startAt": 0}
+    if "seen_issue_keys" in state:
+        # checkpoints from before the key log kept every scraped key inline. They are adopted as they are:
+        # move the keys to the log and rewrite the checkpoint without them in the same step, so it happens once
+        with open(keys_path(project_key), "a", encoding="utf-8") as f:
+            f.writelines(k + "\n" for k in state["seen_issue_keys"])
+        state = {"startAt": state.get("startAt", 0)}
+        save_state(project_key, state)
+        return state
+    if state.get("version") == STATE_VERSION and state.get("config_hash") == config_hash():
+        return state
+    suffix = f".{int(state.get('ts') or time.time())}"
+    for stale in (*output_paths(project_key), keys_path(project_key)):
+        try:
+            os.replace(stale, stale + suffix)
+        except FileNotFoundError:
+            pass
+    logging.warning(
+        "Discarding checkpoint %s: written by a different scraper config; previous output renamed to *%s",
+        path, suffix,
+    )
+    return {"startAt": 0}
+
+
+class SeenKeys:
+    """Issue keys already written for one project: a bloom filter over the append-only key log,
+    with bloom hits confirmed against the log so false positives drop nothing."""
+
+    def __init__(self, project_key: str):
+        self.path = keys_path(project_key)
+        # a page asks about MAX_RESULTS keys at once, so size the per-key rate for ~0.1% of pages to hit
+        # falsely (1e-6 at 1000-issue pages); otherwise most pages would pay for a full log scan
+        self.bloom = ScalableBloomFilter(initial_capacity=10000, error_rate=0.001 / MAX_RESULTS)
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    self.bloom.add(line.rstrip("\n"))
+        except FileNotFoundError:
+            pass
+
+    def already_seen(self, keys: List[str]) -> set:
+        maybe = {k for k in keys if k in self.bloom}
+        if not maybe:
+            return maybe
+        with open(self.path, "r", encoding="utf-8") as f:
+            return {k for k in (line.rstrip("\n") for line in f) if k in maybe}
+
+    def add(self, keys: List[str]):
+        """Record newly scraped keys; O(batch) per page instead of re-serializing every key seen so far."""
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.writelines(k + "\n" for k in keys)
+        for k in keys:
+            self.bloom.add(k)
 
 
 def save_state(project_key: str, state: Dict[str, Any]):
+    """Write the checkpoint to a temp file and atomically swap it in, so a crash never leaves it half-written."""
     path = os.path.join(STATE_DIR, f"{project_key}.json")
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(state, f, indent=2)
+    tmp = path + ".tmp"
+    payload = {
+        "version": STATE_VERSION,
+        "config_hash": config_hash(),
+        "startAt": state["startAt"],
+        "ts": time.time(),
+    }
+    with open(tmp, "wb") as f:
+        f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def write_jsonl(path: str, lines: List[bytes]):
+    """Append a batch of already-serialized JSONL lines with a single write."""
+    with open(path, "ab") as f:
+        f.write(b"".join(lines))
+
+
+def output_paths(project_key: str):
+    return (
+        os.path.join(OUTPUT_DIR, f"{project_key}_raw.jsonl"),
+        os.path.join(OUTPUT_DIR, f"{project_key}_transformed.jsonl"),
+    )
+
+
+def commit_page(seen: SeenKeys, project_key: str, entries: List[Tuple[str, bytes, bytes]], start_at: int):
+    """Persist one scraped page: new records first, then their keys, then the checkpoint that points past it."""
+    dupes = seen.already_seen([key for key, _, _ in entries])
+    if dupes:
+        entries = [e for e in entries if e[0] not in dupes]
+    raw_out, transformed_out = output_paths(project_key)
+    if entries:
+        write_jsonl(raw_out, [raw for _, raw, _ in entries])
+        write_jsonl(transformed_out, [transformed for _, _, transformed in entries])
+        seen.add([key for key, _, _ in entries])
+    save_state(project_key, {"startAt": start_at})
+
+
+async def writer(write_queue: asyncio.Queue, scrapers: Dict[str, asyncio.Task]) -> Dict[str, Exception]:
+    """Single consumer of every output and state file; dedupes via SeenKeys and writes in a worker thread.
+    A project whose page fails to persist is cancelled; returns those failures by project."""
+    seen_keys: Dict[str, SeenKeys] = {}
+    failed: Dict[str, Exception] = {}
+    while True:
+        item = await write_queue.get()
+        if item is None:
+            return failed
+        project_key = item[0]
+        if project_key in failed:
+            continue
+        try:
+            if project_key not in seen_keys:
+                seen_keys[project_key] = await asyncio.to_thread(SeenKeys, project_key)
+            await asyncio.to_thread(commit_page, seen_keys[project_key], *item)
+        except Exception as e:
+            logging.exception("Failed to write output for project %s: %s", project_key, e)
+            failed[project_key] = e
+            # nothing more for this project will be written, so stop paging it
+            scrapers[project_key].cancel()
+
+
+_EMPTY: Dict[str, Any] = {}  # shared stand-in for missing sub-objects; never mutated
+
 
+_comment_parts = operator.itemgetter("author", "created", "body")
 
-def write_jsonl(path: str, records: List[Dict]):
-    mode = "a" if os.path.exists(path) else "w"
-    with open(path, mode, encoding="utf-8") as f:
-        for r in records:
-            f.write(json.dumps(r, ensure_ascii=False) + "\n")
+
+def _field_name(fields: Dict[str, Any], field: str, attr: str):
+    """fields[field][attr] as an interned string (names and statuses repeat across issues), or None if absent."""
+    try:
+        value = fields[field][attr]
+    except (KeyError, TypeError):
+        return None
+    return sys.intern(value) if isinstance(value, str) else value
 
 
 def transform_issue_for_llm(issue_raw: Dict[str, Any]) -> Dict[str, Any]:
@@ -93,25 +300,36 @@ def transform_issue_for_llm(issue_raw: Dict[str, Any]) -> Dict[str, Any]:
     Maps Jira issue structure into a training-friendly JSON object.
     Contains metadata, cleaned description, comments concatenated, and derived tasks.
     """
-    fields = issue_raw.get("fields", {})
-    comments_data = fields.get("comment", {}).get("comments", [])
+    fields = issue_raw.get("fields") or _EMPTY
+    try:
+        comments_data = fields["comment"]["comments"] or ()
+    except (KeyError, TypeError):
+        comments_data = ()
+    intern = sys.intern
     comments_texts = []
+    append = comments_texts.append
     for c in comments_data:
-        author = c.get("author", {}).get("displayName", "")
-        body = c.get("body", "")
-        created = c.get("created", "")
-        comments_texts.append(f"{author} ({created}): {body}")
+        # Jira comments always carry these keys; fall back to lenient lookups only when one is missing
+        try:
+            author, created, body = _comment_parts(c)
+            author = intern(author["displayName"])
+        except (KeyError, TypeError):
+            author = _field_name(c, "author", "displayName") or ""
+            created = c.get("created", "")
+            body = c.get("body", "")
+        append(f"{author} ({created}): {body}")
+    joined_comments = "\n".join(comments_texts)
 
     description = fields.get("description") or ""
     title = fields.get("summary") or ""
     metadata = {
         "issue_key": issue_raw.get("key"),
-        "project": fields.get("project", {}).get("key"),
-        "issuetype": fields.get("issuetype", {}).get("name"),
-        "status": fields.get("status", {}).get("name"),
-        "priority": (fields.get("priority") or {}).get("name"),
-        "reporter": (fields.get("reporter") or {}).get("displayName"),
-        "assignee": (fields.get("assignee") or {}).get("displayName"),
+        "project": _field_name(fields, "project", "key"),
+        "issuetype": _field_name(fields, "issuetype", "name"),
+        "status": _field_name(fields, "status", "name"),
+        "priority": _field_name(fields, "priority", "name"),
+        "reporter": _field_name(fields, "reporter", "displayName"),
+        "assignee": _field_name(fields, "assignee", "displayName"),
         "labels": fields.get("labels", []),
         "created": fields.get("created"),
         "updated": fields.get("updated"),
@@ -119,13 +337,13 @@ def transform_issue_for_llm(issue_raw: Dict[str, Any]) -> Dict[str, Any]:
 
     summarization_prompt = {
         "task": "summarization",
-        "input": f"Title: {title}\n\nDescription:\n{description}\n\nComments:\n" + ("\n".join(comments_texts)),
+        "input": f"Title: {title}\n\nDescription:\n{description}\n\nComments:\n{joined_comments}",
         "output": "",
     }
 
     qna_prompt = {
         "task": "qa",
-        "context": f"{title}\n\n{description}\n\n" + ("\n".join(comments_texts)),
+        "context": f"{title}\n\n{description}\n\n{joined_comments}",
         "qa_pairs": []
     }
 
@@ -143,95 +361,109 @@ def transform_issue_for_llm(issue_raw: Dict[str, Any]) -> Dict[str, Any]:
     return transformed
 
 
-def fetch_issue(issue_key: str, last_time: float):
+def comments_truncated(issue_raw: Dict[str, Any]) -> bool:
+    """True if the embedded comment list holds fewer comments than the issue has."""
+    comment = (issue_raw.get("fields") or _EMPTY).get("comment") or _EMPTY
+    return (comment.get("total") or 0) > len(comment.get("comments") or ())
+
+
+def _serialize(issue_raw: Dict[str, Any]) -> Tuple[str, bytes, bytes]:
+    return (
+        issue_raw.get("key"),
+        orjson.dumps(issue_raw, option=orjson.OPT_APPEND_NEWLINE),
+        orjson.dumps(transform_issue_for_llm(issue_raw), option=orjson.OPT_APPEND_NEWLINE),
+    )
+
+
+def parse_search_page(body: bytes):
+    """Worker process: decode a search response into (total, maxResults, [(key, raw line, transformed line)]).
+    Issues with truncated comments come back as (key, None, None) for a detail fetch."""
+    resp = orjson.loads(body)
+    entries = [
+        (it.get("key"), None, None) if comments_truncated(it) else _serialize(it)
+        for it in resp.get("issues", [])
+    ]
+    return resp.get("total", 0), resp.get("maxResults", MAX_RESULTS), entries
+
+
+def parse_issue(body: bytes) -> Tuple[str, bytes, bytes]:
+    """Runs in a worker process: the parse_search_page counterpart for a single issue detail response."""
+    return _serialize(orjson.loads(body))
+
+
+async def fetch_issue(
+    session: aiohttp.ClientSession,
+    sem: asyncio.Semaphore,
+    limiter: RateLimiter,
+    pool: ProcessPoolExecutor,
+    issue_key: str,
+) -> Tuple[str, bytes, bytes]:
     """Fetch a single issue detail by key (including comments)"""
-    last_time = throttle_sleep(last_time)
     url = JIRA_BASE + ISSUE_ENDPOINT.format(issue_id_or_key=issue_key)
     params = {"fields": FIELDS}
-    r = session.get(url, params=params, timeout=30)
-    if r.status_code == 429:
-        ra = r.headers.get("Retry-After")
-        wait = int(ra) if ra and ra.isdigit() else 60
-        logging.warning("Got 429 for issue %s; sleeping %s seconds", issue_key, wait)
-        time.sleep(wait)
-        return fetch_issue(issue_key, time.time())
-    r.raise_for_status()
-    return r.json(), time.time()
-
-
-def scrape_project(project_key: str):
-    state = read_state(project_key)
+    async with sem:
+        body = await get_with_retry(session, limiter, url, params)
+    return await asyncio.get_running_loop().run_in_executor(pool, parse_issue, body)
+
+
+def search_params(project_key: str, start_at: int) -> Dict[str, Any]:
+    return {
+        "jql": f"project = {project_key} ORDER BY created ASC",
+        "startAt": start_at,
+        "maxResults": MAX_RESULTS,
+        "fields": FIELDS
+    }
+
+
+async def scrape_project(
+    session: aiohttp.ClientSession,
+    sem: asyncio.Semaphore,
+    limiter: RateLimiter,
+    pool: ProcessPoolExecutor,
+    write_queue: asyncio.Queue,
+    project_key: str,
+):
+    state = await asyncio.to_thread(read_state, project_key)
     startAt = state.get("startAt", 0)
-    seen = set(state.get("seen_issue_keys", []))
-    raw_out = os.path.join(OUTPUT_DIR, f"{project_key}_raw.jsonl")
-    transformed_out = os.path.join(OUTPUT_DIR, f"{project_key}_transformed.jsonl")
+    raw_out, transformed_out = output_paths(project_key)
+    loop = asyncio.get_running_loop()
 
     more_to_fetch = True
-    last_time = time.time()
     pbar = None
 
     while more_to_fetch:
-        last_time = throttle_sleep(last_time)
-        jql = f"project = {project_key} ORDER BY created ASC"
-        params = {
-            "jql": jql,
-            "startAt": startAt,
-            "maxResults": MAX_RESULTS,
-            "fields": FIELDS
-        }
         url = JIRA_BASE + SEARCH_ENDPOINT
         logging.info("Querying %s startAt=%s", project_key, startAt)
-        r = session.get(url, params=params, timeout=30)
-        if r.status_code == 429:
-            ra = r.headers.get("Retry-After")
-            wait = int(ra) if ra and ra.isdigit() else 60
-            logging.warning("HTTP 429 received. Sleeping %s seconds", wait)
-            time.sleep(wait)
-            continue
-        if r.status_code >= 500:
-            logging.warning("Server error %s. Backing off.", r.status_code)
-            time.sleep(10)
-            continue
-        r.raise_for_status()
-        resp = r.json()
-        issues = resp.get("issues", [])
-        total = resp.get("total", 0)
+        body = await get_with_retry(session, limiter, url, search_params(project_key, startAt))
+        # decoding and transforming a page is CPU-bound; keep it off the event loop
+        total, max_results, entries = await loop.run_in_executor(pool, parse_search_page, body)
         if pbar is None:
+            if max_results < MAX_RESULTS:
+                logging.info("Server caps %s pages at %s issues", project_key, max_results)
             pbar = tqdm(total=total, desc=f"{project_key} issues", unit="issue")
             pbar.update(startAt)
 
-        if not issues:
+        if not entries:
             logging.info("No issues returned; finishing for project %s", project_key)
             break
 
-        raw_batch = []
-        transformed_batch = []
-        for it in issues:
-            key = it.get("key")
-            if key in seen:
-                pbar.update(1)
-                continue
-            try:
-                issue_full, last_time = fetch_issue(key, last_time)
-            except Exception as e:
-                logging.error("Failed to fetch issue %s: %s", key, e)
-                continue
-
-            raw_batch.append(issue_full)
-            transformed_batch.append(transform_issue_for_llm(issue_full))
-            seen.add(key)
-            pbar.update(1)
-
-        if raw_batch:
-            write_jsonl(raw_out, raw_batch)
-            write_jsonl(transformed_out, transformed_batch)
-
-        startAt = resp.get("startAt", startAt) + len(issues)
-        state["startAt"] = startAt
-        state["seen_issue_keys"] = list(seen)
-        save_state(project_key, state)
-
-        if startAt >= resp.get("total", startAt):
+        # search results already embed comments; only re-fetch issues whose comment list was truncated
+        truncated = [i for i, (_, raw, _) in enumerate(entries) if raw is None]
+        results = await asyncio.gather(
+            *[fetch_issue(session, sem, limiter, pool, entries[i][0]) for i in truncated], return_exceptions=True
+        )
+        for i, entry in zip(truncated, results):
+            if isinstance(entry, Exception):
+                logging.error("Failed to fetch issue %s: %s", entries[i][0], entry)
+                entry = None
+            entries[i] = entry
+
+        startAt += len(entries)
+        entries = [e for e in entries if e is not None]
+        pbar.update(len(entries))
+        await write_queue.put((project_key, entries, startAt))
+
+        if startAt >= total:
             more_to_fetch = False
 
     if pbar:
@@ -239,14 +471,30 @@ def scrape_project(project_key: str):
     logging.info("Finished scraping project %s. Raw -> %s. Transformed -> %s", project_key, raw_out, transformed_out)
 
 
-def main():
+async def main():
     logging.info("Starting Apache Jira scraper for projects: %s", PROJECTS)
-    for proj in PROJECTS:
-        try:
-            scrape_project(proj)
-        except Exception as e:
-            logging.exception("Error scraping project %s: %s", proj, e)
+    sem = asyncio.Semaphore(CONCURRENCY)
+    limiter = RateLimiter(REQUESTS_PER_MINUTE)
+    write_queue = asyncio.Queue(maxsize=WRITE_QUEUE_PAGES)
+    scrapers: Dict[str, asyncio.Task] = {}
+    writer_task = asyncio.create_task(writer(write_queue, scrapers))
+    # workers start lazily, once the event loop and to_thread threads exist; forking then could inherit a held
+    # lock, so start them from a clean forkserver (or spawn where that's unavailable) instead
+    start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    mp_context = multiprocessing.get_context(start_method)
+    with ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=mp_context) as pool:
+        async with make_session() as session:
+            for proj in PROJECTS:
+                scrapers[proj] = asyncio.create_task(scrape_project(session, sem, limiter, pool, write_queue, proj))
+            results = await asyncio.gather(*scrapers.values(), return_exceptions=True)
+    await write_queue.put(None)
+    write_errors = await writer_task
+    for proj, res in zip(PROJECTS, results):
+        if proj in write_errors:
+            logging.error("Error scraping project %s: could not write output: %s", proj, write_errors[proj])
+        elif isinstance(res, Exception):
+            logging.error("Error scraping project %s: %s", proj, res, exc_info=res)
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())